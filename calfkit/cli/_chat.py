@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import asyncio
 import shutil
+import sys
 import traceback
 from typing import TYPE_CHECKING, Any, NamedTuple
 
@@ -38,14 +39,17 @@ if TYPE_CHECKING:
 
     ReadLine = Callable[[str], Awaitable[str]]
 
+# The REPL's leave commands, matched against the stripped input line.
+_EXIT_COMMANDS = frozenset({"/exit", "/quit"})
+
 
 def _width() -> int:
     return shutil.get_terminal_size().columns
 
 
 def _emit(lines: list[str]) -> None:
-    for line in lines:
-        print(line)
+    # One write per rendered block (a step can be a header + a multi-line body), not one per line.
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
 
 
 class _TurnResult(NamedTuple):
@@ -253,18 +257,17 @@ async def _chat_loop(client: Client, agent_name: str, timeout: float | None, rea
     active = agent_name
     gw = client.agent(active)
     history: list[ModelMessage] = []
-    print(f"\nChatting with {active}. Type /exit or press Ctrl-D to leave.")
-    print("-" * _width())
+    _emit([f"\nChatting with {active}. Type /exit or press Ctrl-D to leave.", "-" * _width()])
     while True:
         try:
             line = (await read_line("\nyou > ")).strip()
         except EOFError:  # Ctrl-D
             print()
             break
-        if line in {"/exit", "/quit"}:
-            break
         if not line:
             continue
+        if line in _EXIT_COMMANDS:
+            break
         outcome = await _run_turn(gw, active, line, history, timeout)
         if outcome is None:  # the turn failed / timed out: keep the old history AND the current agent
             continue
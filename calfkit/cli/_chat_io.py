@@ -26,6 +26,7 @@ import codecs
 import io
 import os
 import sys
+from collections import deque
 from collections.abc import Awaitable, Callable
 from typing import Literal
 
@@ -160,12 +161,12 @@ def make_key_reader(loop: asyncio.AbstractEventLoop, fd: int | None = None) -> C
     mechanics as :func:`make_reader` — cancellable, no executor thread; tests inject an ``os.pipe()``
     read-end. An empty read (EOF) yields ``quit``."""
     resolved_fd = fd
-    pending: list[Key] = []
+    pending: deque[Key] = deque()
 
     async def read_key() -> Key:
         nonlocal resolved_fd
         if pending:
-            return pending.pop(0)
+            return pending.popleft()
         if resolved_fd is None:
             resolved_fd = _resolve_stdin_fd()
         read_fd = resolved_fd
@@ -189,7 +190,7 @@ def make_key_reader(loop: asyncio.AbstractEventLoop, fd: int | None = None) -> C
         keys = _decode_keys(chunk)
         if not keys:  # empty read == EOF; treat as cancel
             return "quit"
-        pending.extend(keys[1:])
-        return keys[0]
+        pending.extend(keys)
+        return pending.popleft()
 
     return read_key
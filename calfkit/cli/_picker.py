@@ -40,20 +40,22 @@ class PickerModel:
         self._highlight: str | None = None
         self._descriptions: dict[str, str | None] = {}
 
-    def sync(self, agents: Mapping[str, str | None]) -> None:
+    def sync(self, agents: Mapping[str, str | None]) -> bool:
         """Reconcile with the current online roster (name → description): drop agents that went
         offline (keeping the rest in place), append new arrivals (sorted within the batch), refresh
         descriptions, and keep the highlight on its agent — moving it to the nearest surviving row
-        if that agent went offline."""
+        if that agent went offline. Returns whether anything visible changed (so a steady-state poll
+        tick can skip the redraw)."""
+        previous = (self._order, self._highlight, self._descriptions)
         online = set(agents)
         old_index = self._order.index(self._highlight) if self._highlight in self._order else 0
         self._order = [name for name in self._order if name in online]
-        for name in sorted(online):
-            if name not in self._order:
-                self._order.append(name)
+        # Only the new arrivals are sorted (set difference, not a per-name list scan); survivors keep their rows.
+        self._order.extend(sorted(online.difference(self._order)))
         if self._highlight not in self._order:
             self._highlight = self._order[min(old_index, len(self._order) - 1)] if self._order else None
         self._descriptions = dict(agents)
+        return (self._order, self._highlight, self._descriptions) != previous
 
     def move(self, delta: int) -> None:
         """Shift the highlight by *delta* rows, clamped to the list ends."""
@@ -75,21 +77,27 @@ class PickerModel:
         return self._descriptions.get(name)
 
 
+# The menu chrome never changes — build it once; Rich only reads a Text while rendering it.
+_MENU_HEADER = Text("Select an agent  (↑/↓ move · Enter pick · q quit)")
+_EMPTY_HINT = Text("  (no agents online yet — waiting… press q to quit)")
+
+
 def render_menu(model: PickerModel) -> RenderableType:
     """Render the picker: a header, then one row per online agent — ``❯`` marks the highlighted row,
     and each agent's description follows its (padded) name. An empty roster shows a waiting hint
     (agents may still be coming online)."""
-    header = Text("Select an agent  (↑/↓ move · Enter pick · q quit)")
-    if not model.names:
-        return Group(header, Text("  (no agents online yet — waiting… press q to quit)"))
-    name_width = max(len(name) for name in model.names)
+    names = model.names  # one copy per render (the property copies on every read)
+    if not names:
+        return Group(_MENU_HEADER, _EMPTY_HINT)
+    name_width = max(len(name) for name in names)
+    highlighted = model.highlighted
     rows: list[RenderableType] = []
-    for name in model.names:
-        marker = "❯ " if name == model.highlighted else "  "
+    for name in names:
+        marker = "❯ " if name == highlighted else "  "
         description = model.description(name)
         row = f"{marker}{name.ljust(name_width)}" + (f"  {description}" if description else "")
         rows.append(Text(row))
-    return Group(header, *rows)
+    return Group(_MENU_HEADER, *rows)
 
 
 async def _run_picker(
@@ -98,11 +106,14 @@ async def _run_picker(
     render: Callable[[PickerModel], None],
     *,
     cadence: float,
+    repaint: Callable[[], None] | None = None,
 ) -> str | None:
     """The picker's control loop, decoupled from the terminal (spec §5.1): race a keypress against a
-    re-poll tick. On a tick, re-sync the model from *poll_agents* and re-render; on a key, move /
-    select (Enter) / cancel (quit). The keypress task persists across ticks so a press is never lost
-    to a poll boundary. Returns the selected agent name, or ``None`` if cancelled."""
+    re-poll tick. On a tick, re-sync the model from *poll_agents* and re-render if it changed, else
+    just *repaint* the current frame (the only periodic redraw under ``auto_refresh=False``, so it
+    keeps the menu intact across a terminal resize); on a key, move / select (Enter) / cancel (quit).
+    The keypress task persists across ticks so a press is never lost to a poll boundary. Returns the
+    selected agent name, or ``None`` if cancelled."""
     model = PickerModel()
     model.sync(await poll_agents())
     render(model)
@@ -126,9 +137,11 @@ async def _run_picker(
                     model.move(1)
                 render(model)
                 key_task = asyncio.ensure_future(read_key())
-            else:  # poll tick — the keypress task stays armed
-                model.sync(await poll_agents())
-                render(model)
+            else:  # poll tick — the keypress task stays armed; rebuild the menu only if the roster moved
+                if model.sync(await poll_agents()):
+                    render(model)
+                elif repaint is not None:
+                    repaint()
     finally:
         key_task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
@@ -168,7 +181,7 @@ async def live_pick(client: Client, *, cadence: float = 1.0) -> str | None:
                 live.update(render_menu(model), refresh=True)
 
             try:
-                return await _run_picker(read_key, poll_agents, render, cadence=cadence)
+                return await _run_picker(read_key, poll_agents, render, cadence=cadence, repaint=live.refresh)
             except KeyboardInterrupt:
                 return None
     finally:
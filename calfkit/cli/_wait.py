@@ -112,7 +112,9 @@ class ConsoleWaitReporter:
             self._done.add(name)
             if not self._console.is_terminal:
                 self._console.print(f"{name} ({len(self._done)}/{self._total})", markup=False, highlight=False)
-        if self._console.is_terminal and self._live is not None:
+        # The wait calls update() on every poll tick; rebuild the roster only when a target
+        # resolved — the Live's own auto-refresh keeps the spinners animating in between.
+        if newly and self._console.is_terminal and self._live is not None:
             # A cosmetic side-channel must not fail the operation it decorates: a render glitch
             # degrades to silent rather than aborting the wait.
             with contextlib.suppress(Exception):
@@ -36,6 +36,8 @@ from calfkit.cli.run import run as _run_command
 from calfkit.client._mesh_url import resolve_mesh_url
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from calfkit.client.mesh import AgentInfo, ToolInfo
 
 dev_app = typer.Typer(
@@ -491,6 +493,9 @@ def _status_rows(
 ) -> list[tuple[str, ...]]:
     """The §3.3 join: broker row(s), then managed-daemon rows (scan ⋈ presence by name), then
     every remaining online node — nothing online is ever filtered out (Ryan's transparency rule)."""
+    from datetime import datetime, timezone
+
+    now = datetime.now(tz=timezone.utc)  # one clock read for every row's "last seen" age
     rows: list[tuple[str, ...]] = [_STATUS_HEADER]
     target_elements = set(report.target_key.split(","))
     managed_brokers = [broker for broker in report.brokers if broker.listener in target_elements]
@@ -502,9 +507,9 @@ def _status_rows(
     for hit in daemons:
         for name in hit.names:
             if name in agents:
-                kind, state = "agent", f"online (last seen {_format_age(_age_of(agents[name]))} ago)"
+                kind, state = "agent", f"online (last seen {_format_age(_age_of(agents[name], now))} ago)"
             elif name in tools:
-                kind, state = "tool", f"online (last seen {_format_age(_age_of(tools[name]))} ago)"
+                kind, state = "tool", f"online (last seen {_format_age(_age_of(tools[name], now))} ago)"
             elif not report.reachable:
                 kind, state = "unknown", "unknown (mesh unreachable)"
             else:
@@ -517,17 +522,19 @@ def _status_rows(
     annotation = "not a ck dev daemon (stop it where it runs)"
     for name, agent_info in sorted(agents.items()):
         if name not in managed_names:
-            rows.append(("agent", name, f"online (last seen {_format_age(_age_of(agent_info))} ago) — {annotation}", _EMPTY, _EMPTY, _EMPTY, _EMPTY))
+            rows.append(
+                ("agent", name, f"online (last seen {_format_age(_age_of(agent_info, now))} ago) — {annotation}", _EMPTY, _EMPTY, _EMPTY, _EMPTY)
+            )
     for name, tool_info in sorted(tools.items()):
         if name not in managed_names:
-            rows.append(("tool", name, f"online (last seen {_format_age(_age_of(tool_info))} ago) — {annotation}", _EMPTY, _EMPTY, _EMPTY, _EMPTY))
+            rows.append(
+                ("tool", name, f"online (last seen {_format_age(_age_of(tool_info, now))} ago) — {annotation}", _EMPTY, _EMPTY, _EMPTY, _EMPTY)
+            )
     return rows
 
 
-def _age_of(info: AgentInfo | ToolInfo) -> float:
-    from datetime import datetime, timezone
-
-    age: float = (datetime.now(tz=timezone.utc) - info.last_seen).total_seconds()
+def _age_of(info: AgentInfo | ToolInfo, now: datetime) -> float:
+    age: float = (now - info.last_seen).total_seconds()
     return age
 
 
@@ -31,7 +31,7 @@ whole-turn events at low memory — tunable from the ``EventStream.dropped`` sig
 """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunCompleted:
     """A run's successful terminal (spec §3.3).
 
@@ -47,7 +47,7 @@ class RunCompleted:
     _envelope: Envelope = field(repr=False, compare=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunFailed:
     """A run's fault terminal: the ``ErrorReport`` carried verbatim (mapped to ``NodeFaultError``
     by ``result()``, spec §5.9)."""
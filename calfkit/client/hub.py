@@ -96,8 +96,13 @@ class _RunChannel:
     is a **benign no-op** (the §5.2/§5.5 terminal-dedup). A typed close error (e.g.
     ``ClientClosedError`` from ``aclose()``, §5.8) is stored as a **value** and raised on read —
     never ``future.set_exception`` (§3 decision 1: avoids asyncio's "exception never retrieved").
+
+    One channel is allocated per run, so it is slotted (no per-instance ``__dict__``); the owning
+    handle stays a plain dataclass because the hub's routing map weak-references it.
     """
 
+    __slots__ = ("_terminal", "_closed", "_closed_error", "_arrived", "_intermediates", "_intermediate_ready")
+
     def __init__(self) -> None:
         self._terminal: RunTerminal | None = None
         self._closed: bool = False
@@ -402,13 +407,16 @@ class _Hub:
             logger.debug("dropped a malformed/undecodable step (best-effort; never faults the run)")
             return
         handle = self._runs.get(step.correlation_id)
+        # Resolve the per-run push and the tee once per message, not once per event in the batch.
+        push = handle._channel.push_intermediate if handle is not None else None
+        tee = self._tee
         for wire_event in step.events:
             if wire_event.kind not in _SURFACE_BY_KIND:
                 continue  # AgentThinkingStep — defined-not-emitted in v1 (§5), never surfaced on a stream
             event = _to_surface(wire_event, step)
-            if handle is not None:
-                handle._channel.push_intermediate(event)  # synchronous, non-blocking (consume-once queue)
-            self._tee(event)  # firehose: every step is surfaced raw, demux'd or not (§5.4)
+            if push is not None:
+                push(event)  # synchronous, non-blocking (consume-once queue)
+            tee(event)  # firehose: every step is surfaced raw, demux'd or not (§5.4)
 
     def fail_run(self, correlation_id: str, report: ErrorReport) -> None:
         """The Option-B undecodable-sink target (§5.8): the decode floor calls this for an undecodable
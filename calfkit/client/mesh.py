@@ -41,7 +41,7 @@ logger = logging.getLogger(__name__)
 # discriminator field.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentInfo:
     """One online agent, projected from its ``AgentCard`` (spec §5.3)."""
 
@@ -53,7 +53,7 @@ class AgentInfo:
     """Aware UTC — the agent's last heartbeat; the liveness basis."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolSpec:
     """One tool advertised within a toolbox (spec §5.3)."""
 
@@ -63,7 +63,7 @@ class ToolSpec:
     parameters_schema: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolNodeInfo:
     """One online function tool node — its single tool inlined (spec §5.3).
 
@@ -77,7 +77,7 @@ class ToolNodeInfo:
     last_seen: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolboxInfo:
     """One online MCP toolbox — its name and the tools it advertises (spec §5.3).
 
@@ -139,6 +139,11 @@ class BaseAgentNodeDef(
         if any(h.discover for h in handoff) and len(handoff) > 1:
             raise ValueError("Handoff(discover=True) is the exclusive author of the handoff scope — no other Handoff handle may accompany it")
         self._peers: tuple[Messaging | Handoff, ...] = peer_handles
+        # The per-kind splits are read several times per turn (tool-def rendering, reachability, handoff
+        # arbitration) and ``peers=`` is fixed at construction — freeze the splits built for the checks above
+        # (tuples, so a caller mutating a handles view cannot reshape the agent's peer scope).
+        self._messaging_peers: tuple[Messaging, ...] = tuple(messaging)
+        self._handoff_peers: tuple[Handoff, ...] = tuple(handoff)
         # Reserve the built-in tool names against the construction-time tool surface (§5.2, handoff spec
         # §2/§3.0) — PER-HANDLE-KIND: each built-in is injected into the ExternalToolset OUTSIDE
         # tools_registry, so the intra-registry collision guard would not see it. A `Messaging` handle
@@ -373,12 +378,12 @@ class BaseAgentNodeDef(
             return str(extract_lenient(parts))
 
     @property
-    def _messaging_handles(self) -> list[Messaging]:
-        return [h for h in self._peers if isinstance(h, Messaging)]
+    def _messaging_handles(self) -> tuple[Messaging, ...]:
+        return self._messaging_peers
 
     @property
-    def _handoff_handles(self) -> list[Handoff]:
-        return [h for h in self._peers if isinstance(h, Handoff)]
+    def _handoff_handles(self) -> tuple[Handoff, ...]:
+        return self._handoff_peers
 
     def _message_agent_tool_def(self, ctx: SessionRunContext) -> ToolDefinition | None:
         """The runtime-rendered ``message_agent`` external tool def (§5.2), or ``None`` when the agent
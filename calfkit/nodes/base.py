@@ -1948,15 +1948,18 @@ class BaseNodeDef(BaseNodeSchema, LifecycleHookMixin, RegistryMixin, AdvertRegis
                 )
                 await self._flush_steps(ledger, snapshot, correlation_id, task_id, broker, disposition=None)
                 return await self._fault_response(report, snapshot, envelope, correlation_id, task_id, broker)
-            logger.debug(
-                "[%s] no handler produced a result for route=%s on node=%s (reason=%s); fire-and-forget no-op; registered=%s%s",
-                correlation_id[:8],
-                route,
-                self.node_id,
-                output.reason,
-                tuple(type(self)._handlers),
-                body_note,
-            )
+            # Level-guarded: this declined arm can be routine on a shared topic, and the registered-handler
+            # tuple is built eagerly as a log argument even when DEBUG is off.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[%s] no handler produced a result for route=%s on node=%s (reason=%s); fire-and-forget no-op; registered=%s%s",
+                    correlation_id[:8],
+                    route,
+                    self.node_id,
+                    output.reason,
+                    tuple(type(self)._handlers),
+                    body_note,
+                )
             # The fire-and-forget declined arm still flushes (near-always an empty no-op; a frameless
             # inbound has an EMPTY stack — the helper's guarded root read covers it).
             await self._flush_steps(ledger, snapshot, correlation_id, task_id, broker, disposition=None)
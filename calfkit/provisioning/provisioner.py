@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import random
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any, Literal
@@ -17,12 +18,15 @@ _CODE_NONE = 0  # NoError -> created
 _CODE_TOPIC_ALREADY_EXISTS = 36  # idempotent success
 _CODE_TOPIC_AUTHORIZATION_FAILED = 29  # ACL denied -> warn + continue
 
-# Bounded backoff between retriable create attempts (seconds). The
-# create/classify/retry loop is capped by ``ProvisioningConfig.create_timeout_ms``
-# via the ``asyncio.wait_for`` inside :func:`provision_topics`; the standalone
-# ``TopicProvisioner.provision`` bounds the admin ``start()`` under the same
-# budget separately.
-_RETRY_BACKOFF_S = 0.5
+# Jittered exponential backoff between retriable create attempts: 0.1s doubling
+# to a 2s cap with ±25% jitter, all within the overall ``create_timeout_ms``
+# budget. The first retry comes quickly (a transient broker state usually clears
+# fast); the jitter keeps workers booting together from retrying in lockstep.
+# That budget caps the create/classify/retry loop via the ``asyncio.wait_for``
+# inside :func:`provision_topics`; the standalone ``TopicProvisioner.provision`` bounds
+# the admin ``start()`` under the same budget separately.
+_RETRY_BACKOFF_S = 0.1
+_RETRY_BACKOFF_MAX_S = 2.0
 
 
 def topics_for_nodes(nodes: Iterable[Any]) -> list[str]:
@@ -49,25 +53,20 @@ def topics_for_nodes(nodes: Iterable[Any]) -> list[str]:
 
     The result is de-duplicated while preserving first-seen order.
     """
-    seen: dict[str, None] = {}
-
-    def _add(topic: str | None) -> None:
-        if topic and topic not in seen:
-            seen[topic] = None
-
+    candidates: list[str | None] = []
     for node in nodes:
-        for topic in node.subscribe_topics:
-            _add(topic)
-        _add(node._return_topic)
-        _add(node._private_input_topic)
-        _add(node.publish_topic)
+        candidates.extend(node.subscribe_topics)
+        candidates.append(node._return_topic)
+        candidates.append(node._private_input_topic)
+        candidates.append(node.publish_topic)
 
         tools = getattr(node, "tools", None)
         if tools:
-            for binding in tools:
-                _add(binding.dispatch_topic)
+            candidates.extend(binding.dispatch_topic for binding in tools)
 
-    return list(seen)
+    # Drop unset topics once, then de-dup in a single C-level pass (dict keeps
+    # first-seen order) — no per-topic closure call or membership branch.
+    return list(dict.fromkeys(topic for topic in candidates if topic))
 
 
 def framework_topics_for_nodes(nodes: Iterable[Any]) -> set[str]:
@@ -237,6 +236,7 @@ async def _provision_loop(
     """Create-classify-retry loop. ``last_pending`` is updated in place so the
     timeout handler in :func:`provision_topics` can name what is still missing."""
     report = ProvisionReport()
+    backoff = _RETRY_BACKOFF_S
     while pending:
         last_pending[:] = pending
         new_topics = [_build_new_topic(t, framework_topics, config) for t in pending]
@@ -273,7 +273,8 @@ async def _provision_loop(
             )
         pending = next_pending
         if pending:
-            await asyncio.sleep(_RETRY_BACKOFF_S)
+            await asyncio.sleep(backoff * random.uniform(0.75, 1.25))
+            backoff = min(backoff * 2, _RETRY_BACKOFF_MAX_S)
             last_pending[:] = pending
     return report
 
@@ -15,9 +15,10 @@ Test layout mirrors the project's established patterns:
   ``tests/test_headers.py::test_gate_reject_auto_publish_carries_emitter_header``).
 - ``consumer()`` sinks with reply-slot gates for counting final
   hops (per ``tests/test_consumer.py``).
-- ``wait_for_condition`` from ``tests/utils.py`` for deterministic settling.
+- ``wait_until`` from ``tests/utils.py``, woken by the sinks/observers, for deterministic settling.
 """
 
+import asyncio
 from typing import Annotated, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -50,7 +51,7 @@ from calfkit.nodes import ConsumerNode, StatelessAgent, ToolNodeDef, agent_tool,
 from calfkit.nodes._steps import DeniedCall, Observed
 from calfkit.worker import Worker
 from tests.providers import get_users_name, prepare_worker
-from tests.utils import wait_for_condition
+from tests.utils import wait_until
 
 SHARED_INPUT = "co_tenant_chan.in"
 
@@ -120,6 +121,7 @@ async def test_tool_return_does_not_leak_between_co_tenant_agents(container):
 
     alpha_finals: list[ConsumerContext] = []
     bravo_finals: list[ConsumerContext] = []
+    progressed = asyncio.Event()
 
     @consumer(
         subscribe_topics="alpha_agent.out",
@@ -129,6 +131,7 @@ async def test_tool_return_does_not_leak_between_co_tenant_agents(container):
         if not ctx.output_parts:
             return  # intermediate hop — keep only terminal outputs (self-filter, gates retired)
         alpha_finals.append(ctx)
+        progressed.set()
 
     @consumer(
         subscribe_topics="bravo_agent.out",
@@ -138,6 +141,7 @@ async def test_tool_return_does_not_leak_between_co_tenant_agents(container):
         if not ctx.output_parts:
             return  # intermediate hop — keep only terminal outputs (self-filter, gates retired)
         bravo_finals.append(ctx)
+        progressed.set()
 
     # ``shared_tool`` is added to the worker once even though both agents
     # reference it in their ``tools=`` lists — agents' tool registries are
@@ -152,14 +156,15 @@ async def test_tool_return_does_not_leak_between_co_tenant_agents(container):
 
     async with TestKafkaBroker(broker):
         await client.agent(topic=SHARED_INPUT).start("hi")
-        await wait_for_condition(
+        await wait_until(
             lambda: len(alpha_finals) >= 1 and len(bravo_finals) >= 1,
             timeout=5.0,
+            wake=progressed,
         )
     # TestKafkaBroker dispatches publishes synchronously through its
     # in-memory ``FakeProducer``, so any duplicate final the buggy code would
     # have produced has already landed in ``alpha_finals``/``bravo_finals``
-    # by the time ``wait_for_condition`` resolves — no explicit drain needed.
+    # by the time ``wait_until`` resolves — no explicit drain needed.
 
     assert len(alpha_finals) == 1, f"alpha emitted {len(alpha_finals)} finals (expected 1); peer-tool-return leak"
     assert len(bravo_finals) == 1, f"bravo emitted {len(bravo_finals)} finals (expected 1); peer-tool-return leak"
@@ -177,6 +182,7 @@ async def test_single_call_writes_private_return_topic_as_callback(container):
     subscribe topic.
     """
     captured: list[tuple[str, str]] = []  # (target, callback)
+    progressed = asyncio.Event()
 
     @agent_tool
     def probe_tool() -> str:
@@ -199,12 +205,13 @@ async def test_single_call_writes_private_return_topic_as_callback(container):
     async def _observe(envelope: Envelope, headers: Annotated[dict[str, Any], Context("message.headers")]) -> None:
         frame = envelope.internal_workflow_state.current_frame
         captured.append((frame.target_topic, frame.callback_topic))
+        progressed.set()
 
     prepare_worker(container)
 
     async with TestKafkaBroker(broker):
         await client.agent(topic=agent.subscribe_topics[0]).start("hi")
-        await wait_for_condition(lambda: len(captured) >= 1, timeout=5.0)
+        await wait_until(lambda: len(captured) >= 1, timeout=5.0, wake=progressed)
 
     assert captured, "tool input topic never received the Call envelope"
     target, callback = captured[0]
@@ -225,6 +232,7 @@ async def test_parallel_call_writes_private_return_topic_as_callback(container):
     captured_a: list[str] = []
     captured_b: list[str] = []
     captured_c: list[str] = []
+    progressed = asyncio.Event()
 
     @agent_tool
     def fanout_tool_a() -> str:
@@ -254,22 +262,26 @@ async def test_parallel_call_writes_private_return_topic_as_callback(container):
     @broker.subscriber(fanout_tool_a.subscribe_topics[0], group_id="parallel_callback_obs_a")
     async def _obs_a(envelope: Envelope) -> None:
         captured_a.append(envelope.internal_workflow_state.current_frame.callback_topic)
+        progressed.set()
 
     @broker.subscriber(fanout_tool_b.subscribe_topics[0], group_id="parallel_callback_obs_b")
     async def _obs_b(envelope: Envelope) -> None:
         captured_b.append(envelope.internal_workflow_state.current_frame.callback_topic)
+        progressed.set()
 
     @broker.subscriber(fanout_tool_c.subscribe_topics[0], group_id="parallel_callback_obs_c")
     async def _obs_c(envelope: Envelope) -> None:
         captured_c.append(envelope.internal_workflow_state.current_frame.callback_topic)
+        progressed.set()
 
     prepare_worker(container)
 
     async with TestKafkaBroker(broker):
         await client.agent(topic=agent.subscribe_topics[0]).start("hi")
-        await wait_for_condition(
+        await wait_until(
             lambda: len(captured_a) >= 1 and len(captured_b) >= 1 and len(captured_c) >= 1,
             timeout=5.0,
+            wake=progressed,
         )
 
     all_callbacks = captured_a + captured_b + captured_c
@@ -121,7 +121,7 @@ def test_message_agent_name_not_reserved_for_handoff_only_agent() -> None:
         tool_def=ToolDefinition(name="message_agent", description="x", parameters_json_schema={"type": "object", "properties": {}}),
     )
     agent = StatelessAgent("triage", subscribe_topics="triage.in", model_client=TestModel(), tools=[user_tool], peers=[Handoff("refunds")])
-    assert agent._handoff_handles == [Handoff("refunds")]
+    assert agent._handoff_handles == (Handoff("refunds"),)
     assert "message_agent" in {b.name for b in agent.tools}  # the user tool survives, unreserved
 
 
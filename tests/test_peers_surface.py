@@ -203,14 +203,14 @@ def test_handoff_is_exported_first_class() -> None:
 def test_agent_peers_accepts_handoff_and_exposes_handoff_handles() -> None:
     a = _agent(peers=[Handoff("refunds"), Handoff("billing")])
     assert a._peers == (Handoff("refunds"), Handoff("billing"))
-    assert a._handoff_handles == [Handoff("refunds"), Handoff("billing")]
+    assert a._handoff_handles == (Handoff("refunds"), Handoff("billing"))
 
 
 def test_agent_messaging_and_handoff_compose_independently() -> None:
     # A mixed peers= list keeps each capability's handles separate (per-capability scope).
     a = _agent(peers=[Messaging("billing"), Handoff("refunds")])
-    assert a._messaging_handles == [Messaging("billing")]
-    assert a._handoff_handles == [Handoff("refunds")]
+    assert a._messaging_handles == (Messaging("billing"),)
+    assert a._handoff_handles == (Handoff("refunds"),)
 
 
 def test_agent_handoff_self_reject() -> None:
@@ -241,15 +241,15 @@ def test_agent_per_capability_discover_scopes_are_independent() -> None:
     # named handle of the OTHER (discover Messaging + named Handoff is fine, and vice versa).
     a = _agent(peers=[Messaging(discover=True), Handoff("refunds")])
     assert a._messaging_handles[0].discover is True
-    assert a._handoff_handles == [Handoff("refunds")]
+    assert a._handoff_handles == (Handoff("refunds"),)
     b = _agent(peers=[Handoff(discover=True), Messaging("billing")])
     assert b._handoff_handles[0].discover is True
-    assert b._messaging_handles == [Messaging("billing")]
+    assert b._messaging_handles == (Messaging("billing"),)
 
 
 def test_same_name_in_messaging_and_handoff_is_allowed_and_partitioned() -> None:
     # Per-capability independence: the SAME peer may be both messageable AND a handoff target — the handles
     # partition by type (no dedupe across kinds), so the agent can consult billing OR transfer to it.
     a = _agent(peers=[Messaging("billing"), Handoff("billing")])
-    assert a._messaging_handles == [Messaging("billing")]
-    assert a._handoff_handles == [Handoff("billing")]
+    assert a._messaging_handles == (Messaging("billing"),)
+    assert a._handoff_handles == (Handoff("billing"),)
@@ -197,6 +197,33 @@ async def test_run_picker_resyncs_the_roster_on_a_poll_tick() -> None:
     assert any("z" in names for names in seen)  # the tick picked up the newly-online agent
 
 
+def test_sync_reports_whether_the_roster_changed() -> None:
+    model = PickerModel()
+    assert model.sync(_roster("a", "b")) is True
+    assert model.sync(_roster("a", "b")) is False  # steady state: nothing to redraw
+    assert model.sync({"a": "new description", "b": None}) is True
+    assert model.sync({"a": "new description"}) is True  # 'b' went offline
+
+
+async def test_run_picker_skips_the_redraw_on_an_unchanged_poll_tick() -> None:
+    async def poll() -> dict[str, str | None]:
+        return _roster("a")
+
+    keys: asyncio.Queue[Key] = asyncio.Queue()
+
+    async def read_key() -> Key:
+        return await keys.get()
+
+    renders: list[list[str]] = []
+    repaints: list[None] = []
+    task = asyncio.create_task(_run_picker(read_key, poll, lambda m: renders.append(m.names), cadence=0.01, repaint=lambda: repaints.append(None)))
+    await asyncio.sleep(0.08)  # several ticks, none of which changes the roster
+    await keys.put("quit")
+    assert await asyncio.wait_for(task, 1.0) is None
+    assert renders == [["a"]]  # only the initial draw
+    assert repaints  # ...but each unchanged tick still repaints the current frame (terminal resize)
+
+
 async def test_live_pick_end_to_end_over_a_pty(monkeypatch: object) -> None:
     """Smoke-test the real glue (cbreak + key reader + loop) over a pseudo-terminal: navigate down
     one and select. Exercises termios set/restore and make_key_reader against a real tty."""
@@ -322,6 +322,38 @@ def test_retriable_code_retries_then_succeeds(monkeypatch, retriable_code) -> No
     assert created[0].close_calls == 1
 
 
+def test_retry_backoff_doubles_up_to_the_cap_with_jitter(monkeypatch) -> None:
+    # Seven retriable rounds, then created: enough doublings to hit the cap twice.
+    plan = [[("t.topic", 5)]] * 7 + [[("t.topic", 0)]]
+    created = _install_fake_admin(
+        monkeypatch,
+        lambda kw: _FakeAdmin(error_plan=plan, kwargs=kw),
+    )
+    sleeps: list[float] = []
+    jitter_ranges: list[tuple[float, float]] = []
+
+    async def _fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    def _fake_uniform(low: float, high: float) -> float:
+        jitter_ranges.append((low, high))
+        return 1.0
+
+    monkeypatch.setattr(provisioner_mod.asyncio, "sleep", _fake_sleep)
+    monkeypatch.setattr(provisioner_mod.random, "uniform", _fake_uniform)
+
+    report = asyncio.run(_provisioner().provision(["t.topic"], framework_topics=set()))
+
+    assert report.created == ["t.topic"]
+    assert len(created[0].create_calls) == 8
+    # One sleep per retriable round: geometric from the base, then pinned at the cap.
+    assert sleeps == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.6, 2.0, 2.0])
+    assert provisioner_mod._RETRY_BACKOFF_S == 0.1
+    assert provisioner_mod._RETRY_BACKOFF_MAX_S == 2.0
+    # Every delay is jittered by +/-25%.
+    assert jitter_ranges == [(0.75, 1.25)] * 7
+
+
 def test_timeout_raises_naming_pending(monkeypatch) -> None:
     monkeypatch.setattr(provisioner_mod, "_RETRY_BACKOFF_S", 0)
     # Always retriable -> never resolves -> the wait_for budget must fire.
@@ -166,6 +166,28 @@ def test_tty_success_finalize_uses_the_success_label() -> None:
     assert "✔ dev broker ready" in _ANSI.sub("", buf.getvalue())
 
 
+def test_tty_update_without_progress_does_not_rebuild_the_roster() -> None:
+    # The wait pushes a snapshot every poll tick; only a tick that resolves a target re-renders.
+    console, _ = _tty_console()
+
+    class _CountingLive:
+        updates = 0
+
+        def update(self, *a: object, **k: object) -> None:
+            self.updates += 1
+
+        def stop(self) -> None:
+            pass
+
+    live = _CountingLive()
+    with ConsoleWaitReporter("t", ["a", "b"], console=console) as reporter:
+        reporter._live = live  # type: ignore[assignment]
+        reporter.update(set())
+        reporter.update({"a"})
+        reporter.update({"a"})
+    assert live.updates == 1
+
+
 def test_reporter_isolates_live_faults_from_the_wait() -> None:
     # A rich render/teardown glitch in the live view must never abort or mask the wait it decorates.
     console, _ = _tty_console()